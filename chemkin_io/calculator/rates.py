@@ -170,7 +170,7 @@ def reaction(rxn_dstr, rxn_units, t_ref, temps, pressures=None, collider=None):
     troe_params = rxn_parser.troe_parameters(rxn_dstr)
     chebyshev_params = rxn_parser.chebyshev_parameters(rxn_dstr)
     plog_params = rxn_parser.plog_parameters(rxn_dstr)
-    collid_dct = rxn_parser.collider_enhance_factors(rxn_dstr)
+    collid_dct = rxn_parser.buffer_enhance_factors(rxn_dstr)
 
     # Determine if any pdep params at all are found
     any_pdep = any(params is not None
@@ -2,11 +2,12 @@
 """
 
 
+import functools
 import itertools
+import re
+from collections import defaultdict, namedtuple
 import numpy
 import autoparse.pattern as app
-import autoparse.find as apf
-from autoparse import cast as ap_cast
 from ioformat import headlined_sections
 
 
@@ -34,31 +35,196 @@ COEFF_PATTERN = (app.NUMBER + app.LINESPACES + app.NUMBER +
 BAD_STRS = ['inf', 'INF', 'nan']
 
 
+def _first_line_pattern(rct_ptt, prd_ptt, param_ptt):
+    """ Defines the pattern for the first line in a reaction data
+        string that contains the chemical equation and high-pressure
+        fitting parameters for the reaction.
+
+        :param rct_ptt: string pattern for the reactant species
+        :type rct_ptt: str
+        :param prd_ptt: string pattern for the product species
+        :type prd_ptt: str
+        :param param_ptt: string pattern for high-pressure parameters
+        :type param_ptt: str
+        :rtype: str
+    """
+    return (rct_ptt + app.padded(CHEMKIN_ARROW) + prd_ptt +
+            app.LINESPACES + param_ptt)
+
+
+# Compile all of the patterns once at import so that parsing a large
+# mechanism does not rebuild and recompile them for every reaction
+FIRST_LINE_PATTERN = _first_line_pattern(
+    rct_ptt=SPECIES_NAMES_PATTERN,
+    prd_ptt=SPECIES_NAMES_PATTERN,
+    param_ptt=COEFF_PATTERN)
+_PRESSURE_REGION_RE = re.compile(
+    app.capturing(FIRST_LINE_PATTERN), re.MULTILINE)
+_RCT_NAMES_RE = re.compile(
+    _first_line_pattern(
+        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+        prd_ptt=SPECIES_NAMES_PATTERN,
+        param_ptt=COEFF_PATTERN),
+    re.MULTILINE)
+_PRD_NAMES_RE = re.compile(
+    _first_line_pattern(
+        rct_ptt=SPECIES_NAMES_PATTERN,
+        prd_ptt=app.capturing(SPECIES_NAMES_PATTERN),
+        param_ptt=COEFF_PATTERN),
+    re.MULTILINE)
+_HIGH_P_RE = re.compile(
+    _first_line_pattern(
+        rct_ptt=SPECIES_NAMES_PATTERN,
+        prd_ptt=SPECIES_NAMES_PATTERN,
+        param_ptt=(app.capturing(app.NUMBER) + app.LINESPACES +
+                   app.capturing(app.NUMBER) + app.LINESPACES +
+                   app.capturing(app.NUMBER))),
+    re.MULTILINE)
+_LOW_P_RE = re.compile(
+    'LOW' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_TROE_RE = re.compile(
+    'TROE' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.SPACES + app.capturing(app.NUMBER) +
+    app.maybe(app.SPACES + app.capturing(app.NUMBER)) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_CHEB_TEMP_RE = re.compile(
+    'TCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.SPACES + app.capturing(app.FLOAT) +
+    app.SPACES + app.capturing(app.FLOAT) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_CHEB_PRESSURE_RE = re.compile(
+    'PCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.SPACES + app.capturing(app.FLOAT) +
+    app.SPACES + app.capturing(app.FLOAT) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_CHEB_ALPHA_DIM_RE = re.compile(
+    'CHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.SPACES + app.capturing(app.INTEGER) +
+    app.SPACES + app.capturing(app.INTEGER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_CHEB_ALPHA_ELM_RE = re.compile(
+    'CHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.series(
+        app.capturing(app.SPACES + app.capturing(app.EXPONENTIAL_FLOAT)),
+        app.SPACES) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+_PLOG_RE = re.compile(
+    'PLOG' +
+    app.zero_or_more(app.SPACE) + app.escape('/') +
+    app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
+    app.zero_or_more(app.SPACE) + app.escape('/'),
+    re.MULTILINE)
+# Combined pattern for the auxiliary data lines (LOW, TROE, CHEB and
+# PLOG), so that a single scan over a reaction string locates all of
+# them; each alternative is named so matches can be dispatched by kind
+_AUX_KIND_RES = (
+    ('low', _LOW_P_RE),
+    ('troe', _TROE_RE),
+    ('tcheb', _CHEB_TEMP_RE),
+    ('pcheb', _CHEB_PRESSURE_RE),
+    ('chebdim', _CHEB_ALPHA_DIM_RE),
+    ('chebelm', _CHEB_ALPHA_ELM_RE),
+    ('plog', _PLOG_RE))
+_AUX_RE = re.compile(
+    '|'.join('(?P<{0}>{1})'.format(kind, rgx.pattern)
+             for kind, rgx in _AUX_KIND_RES),
+    re.MULTILINE)
+# Slices picking each alternative's own captures out of a combined match
+_AUX_CAP_SLICES = {
+    kind: slice(_AUX_RE.groupindex[kind], _AUX_RE.groupindex[kind]+rgx.groups)
+    for kind, rgx in _AUX_KIND_RES}
+_BUFFER_SPECIES_NAME_PATTERN = app.one_or_more(app.one_of_these([
+    app.LETTER, app.DIGIT,
+    app.escape('('), app.escape(')'),
+    app.UNDERSCORE]))
+_BUFFER_FACTOR_RE = re.compile(
+    app.capturing(_BUFFER_SPECIES_NAME_PATTERN) +
+    app.escape('/') + app.maybe(app.SPACE) +
+    app.capturing(app.NUMBER) +
+    app.escape('/'),
+    re.MULTILINE)
+_BUFFER_BAD_LINE_RE = re.compile(
+    app.one_of_these(
+        ['DUP', 'LOW', 'TROE', 'CHEB', 'PLOG', FIRST_LINE_PATTERN]),
+    re.MULTILINE)
+_FIT_PRESSURE_RE = re.compile(
+    'Pressure:' + app.SPACES +
+    app.capturing(app.one_of_these([app.FLOAT, 'High'])),
+    re.MULTILINE)
+_FIT_TRANGE_RE = re.compile(
+    'Temps: ' + app.SPACES +
+    app.capturing(app.INTEGER) + '-' + app.capturing(app.INTEGER) +
+    app.SPACES + 'K',
+    re.MULTILINE)
+_FIT_MEAN_ERR_RE = re.compile(
+    'MeanAbsErr:' + app.SPACES +
+    app.capturing(app.FLOAT) + app.escape('%') + ',',
+    re.MULTILINE)
+_FIT_MAX_ERR_RE = re.compile(
+    'MaxErr:' + app.SPACES +
+    app.capturing(app.FLOAT) + app.escape('%'),
+    re.MULTILINE)
+
+
+# Container for the parsed reaction data, with one parallel list per
+# field indexed by the position of the reaction in the block
+ReactionData = namedtuple('ReactionData', [
+    'reactant_names', 'product_names',
+    'high_p_parameters', 'low_p_parameters',
+    'troe_parameters', 'chebyshev_parameters',
+    'plog_parameters', 'buffer_enhance_factors'])
+
+
 # Functions which use thermo parsers to collate the data
 def data_block(block_str):
     """ Parses all of the chemical equations and corresponding fitting
         parameters in the reactions block of the mechanism input file
         and subsequently pulls all of the species names and fitting
-        parameters from the data string; this information is stored in a list.
+        parameters from the data strings; this information is stored
+        in parallel lists indexed by reaction.
 
         :param block_str: string for reactions block
         :type block_str: str
-        :return data_block: all the data from the data string for each reaction
-        :rtype: list(list(str))
+        :return rxn_dat: all the data from the data string for each reaction
+        :rtype: ReactionData
     """
 
     rxn_dstr_lst = data_strings(block_str)
-    rxn_dat_lst = tuple(zip(
-        map(reactant_names, rxn_dstr_lst),
-        map(product_names, rxn_dstr_lst),
-        map(high_p_parameters, rxn_dstr_lst),
-        map(low_p_parameters, rxn_dstr_lst),
-        map(troe_parameters, rxn_dstr_lst),
-        map(chebyshev_parameters, rxn_dstr_lst),
-        map(plog_parameters, rxn_dstr_lst),
-        map(collision_enhance_factors, rxn_dstr_lst)))
 
-    return rxn_dat_lst
+    # Parse all eight fields for each reaction in a single pass, then
+    # transpose the rows into the parallel field lists
+    rows = [(reactant_names(rxn_dstr),
+             product_names(rxn_dstr),
+             high_p_parameters(rxn_dstr),
+             low_p_parameters(rxn_dstr),
+             troe_parameters(rxn_dstr),
+             chebyshev_parameters(rxn_dstr),
+             plog_parameters(rxn_dstr),
+             buffer_enhance_factors(rxn_dstr))
+            for rxn_dstr in rxn_dstr_lst]
+    if rows:
+        rxn_dat = ReactionData(*map(list, zip(*rows)))
+    else:
+        rxn_dat = ReactionData(*([] for _ in ReactionData._fields))
+
+    return rxn_dat
 
 
 def data_dct(block_str, data_entry='strings', remove_bad_fits=False):
@@ -74,31 +240,15 @@ def data_dct(block_str, data_entry='strings', remove_bad_fits=False):
 
     rxn_dstr_lst = data_strings(block_str, remove_bad_fits=remove_bad_fits)
     if data_entry == 'strings':
-        rxn_dct = {}
+        # Group the strings in lists and join at the end, rather than
+        # appending to growing strings, to keep the aggregation linear
+        string_dct = defaultdict(list)
         for string in rxn_dstr_lst:
-            # print(string)
             rct_names = reactant_names(string)
             prd_names = product_names(string)
-            key = (rct_names, prd_names)
-            # if key not in rxn_dct:
-            #     rxn_dct[key] = [string]
-            # else:
-            #     rxn_dct[key].append(string)
-            if key not in rxn_dct:
-                rxn_dct[key] = string
-            else:
-                rxn_dct[key] += '\n'+string
-    # elif data_entry == 'block':
-    #     rxn_dct = {}
-    #     for block in rxn_block_lst:
-    #         param_blocks = []
-    #         rct_names = rxn_block_lst[0]
-    #         prd_names = rxn_block_lst[1]
-    #         key = (rct_names, prd_names)
-    #         if key not in rxn_dct.keys():
-    #             rxn_dct[key] = block[2:]
-    #         else:
-    #             rxn_dct[key]
+            string_dct[(rct_names, prd_names)].append(string)
+        rxn_dct = {key: '\n'.join(strings)
+                   for key, strings in string_dct.items()}
 
     return rxn_dct
 
@@ -128,6 +278,7 @@ def data_strings(block_str, remove_bad_fits=False):
     return rxn_dstrs
 
 
+@functools.lru_cache(maxsize=65536)
 def reactant_names(rxn_dstr):
     """ Parses the data string for a reaction in the reactions block
         for the line containing the chemical equation in order to
@@ -139,17 +290,14 @@ def reactant_names(rxn_dstr):
         :rtype: list(str)
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=COEFF_PATTERN
-    )
-    string = apf.first_capture(pattern, rxn_dstr)
+    match = _RCT_NAMES_RE.search(rxn_dstr)
+    string = match.group(1) if match else None
     names = _split_reagent_string(string)
 
     return names
 
 
+@functools.lru_cache(maxsize=65536)
 def product_names(rxn_dstr):
     """ Parses the data string for a reaction in the reactions block
         for the line containing the chemical equation in order to
@@ -161,12 +309,8 @@ def product_names(rxn_dstr):
         :rtype: list(str)
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=app.capturing(SPECIES_NAMES_PATTERN),
-        param_ptt=COEFF_PATTERN
-    )
-    string = apf.first_capture(pattern, rxn_dstr)
+    match = _PRD_NAMES_RE.search(rxn_dstr)
+    string = match.group(1) if match else None
     names = _split_reagent_string(string)
 
     return names
@@ -183,14 +327,8 @@ def pressure_region_specification(rxn_dstr):
         :rtype: str
     """
 
-    pattern = app.capturing(
-        _first_line_pattern(
-            rct_ptt=SPECIES_NAMES_PATTERN,
-            prd_ptt=SPECIES_NAMES_PATTERN,
-            param_ptt=COEFF_PATTERN
-        )
-    )
-    string = apf.first_capture(pattern, rxn_dstr)
+    match = _PRESSURE_REGION_RE.search(rxn_dstr)
+    string = match.group(1) if match else None
 
     if string is not None:
         string = string.strip()
@@ -223,17 +361,10 @@ def high_p_parameters(rxn_dstr):
         :rtype: list(float)
     """
 
-    pattern = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=app.capturing(COEFF_PATTERN)
-    )
-
-    string_lst = apf.all_captures(pattern, rxn_dstr)
-    if string_lst:
-        params = []
-        for string in string_lst:
-            params.append(list(ap_cast(string.split())))
+    caps_lst = _HIGH_P_RE.findall(rxn_dstr)
+    if caps_lst:
+        params = [[float(val1), float(val2), float(val3)]
+                  for val1, val2, val3 in caps_lst]
     else:
         params = None
 
@@ -253,6 +384,38 @@ def are_highp_fake(highp_params):
     return are_fake
 
 
+@functools.lru_cache(maxsize=65536)
+def _auxiliary_captures(rxn_dstr):
+    """ Locates all of the auxiliary data lines (LOW, TROE, CHEB and
+        PLOG) of a reaction data string with a single scan of the
+        combined pattern, grouping the raw captures by kind.
+
+        :param rxn_dstr: data string for species in reaction block
+        :type rxn_dstr: str
+        :return captures: raw captures for each kind of auxiliary line
+        :rtype: dict[kind: captures]
+    """
+
+    captures = {'low': None, 'troe': None, 'tcheb': None, 'pcheb': None,
+                'chebdim': None, 'chebelm': [], 'plog': []}
+
+    # Most reactions have no auxiliary lines at all, so check for the
+    # keywords with cheap substring scans before running the pattern
+    if not ('LOW' in rxn_dstr or 'TROE' in rxn_dstr or
+            'CHEB' in rxn_dstr or 'PLOG' in rxn_dstr):
+        return captures
+
+    for match in _AUX_RE.finditer(rxn_dstr):
+        kind = match.lastgroup
+        caps = match.groups()[_AUX_CAP_SLICES[kind]]
+        if kind in ('chebelm', 'plog'):
+            captures[kind].append(caps)
+        elif captures[kind] is None:
+            captures[kind] = caps
+
+    return captures
+
+
 def low_p_parameters(rxn_dstr):
     """ Parses the data string for a reaction in the reactions block
         for a line containing the low-pressure fitting parameters,
@@ -264,15 +427,10 @@ def low_p_parameters(rxn_dstr):
         :rtype: list(float)
     """
 
-    pattern = (
-        'LOW' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    cap1 = apf.first_capture(pattern, rxn_dstr)
+    if 'LOW' not in rxn_dstr:
+        return None
+
+    cap1 = _auxiliary_captures(rxn_dstr)['low']
     if cap1 is not None:
         params = [[float(val) for val in cap1]]
     else:
@@ -291,43 +449,17 @@ def troe_parameters(rxn_dstr):
         :return params: Troe fitting parameters
         :rtype: list(float)
     """
-    pattern1 = (
-        'TROE' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.SPACES + app.capturing(app.NUMBER) +
-        app.maybe(app.SPACES + app.capturing(app.NUMBER)) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    # pattern2 = (
-    #     'TROE' +
-    #     app.zero_or_more(app.SPACE) + app.escape('/') +
-    #     app.SPACES + app.capturing(app.NUMBER) +
-    #     app.SPACES + app.capturing(app.NUMBER) +
-    #     app.SPACES + app.capturing(app.NUMBER) +
-    #     app.zero_or_more(app.SPACE) + app.escape('/')
-    # )
-    cap1 = apf.first_capture(pattern1, rxn_dstr)
-    # cap2 = apf.first_capture(pattern2, rxn_dstr)
-    # print('cap1', cap1)
-    # print('cap2', cap1)
-    # cap2 = apf.first_capture(pattern2, rxn_dstr)
-    if cap1 is not None:
-        params = []
-        for val in cap1:
-            if val is not None:
-                params.append(float(val))
-            else:
-                params.append(None)
+    if 'TROE' not in rxn_dstr:
+        return None
+
+    # The fourth capture in the TROE pattern is optional, so the single
+    # pattern matches both the three- and four-parameter TROE lines
+    caps = _auxiliary_captures(rxn_dstr)['troe']
+    if caps is not None:
+        params = [float(val) if val is not None else None
+                  for val in caps]
     else:
         params = None
-    # else:
-    #     if cap2 is not None:
-    #         params = [float(val) for val in cap2]
-    #         params.append(None)
-    #     else:
-    #         params = None
 
     return params
 
@@ -343,39 +475,14 @@ def chebyshev_parameters(rxn_dstr):
         :rtype: dict[param: value]
     """
 
-    temp_pattern = (
-        'TCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.SPACES + app.capturing(app.FLOAT) +
-        app.SPACES + app.capturing(app.FLOAT) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    pressure_pattern = (
-        'PCHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.SPACES + app.capturing(app.FLOAT) +
-        app.SPACES + app.capturing(app.FLOAT) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    alpha_dimension_pattern = (
-        'CHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.SPACES + app.capturing(app.INTEGER) +
-        app.SPACES + app.capturing(app.INTEGER) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    alpha_elements_pattern = (
-        'CHEB' + app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.series(
-            app.capturing(app.SPACES + app.capturing(app.EXPONENTIAL_FLOAT)),
-            app.SPACES
-        ) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
+    if 'CHEB' not in rxn_dstr:
+        return None
 
-    cheb_temps = apf.first_capture(temp_pattern, rxn_dstr)
-    cheb_pressures = apf.first_capture(pressure_pattern, rxn_dstr)
-    alpha_dims = apf.first_capture(alpha_dimension_pattern, rxn_dstr)
-    alpha_elm = apf.all_captures(alpha_elements_pattern, rxn_dstr)
-    if not alpha_elm:
-        alpha_elm = None
+    captures = _auxiliary_captures(rxn_dstr)
+    cheb_temps = captures['tcheb']
+    cheb_pressures = captures['pcheb']
+    alpha_dims = captures['chebdim']
+    alpha_elm = captures['chebelm'] or None
 
     params_dct = {}
     if all(vals is not None
@@ -401,34 +508,23 @@ def plog_parameters(rxn_dstr):
         :rtype: dict[pressure: params]
     """
 
-    pattern = (
-        'PLOG' +
-        app.zero_or_more(app.SPACE) + app.escape('/') +
-        app.zero_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.one_or_more(app.SPACE) + app.capturing(app.NUMBER) +
-        app.zero_or_more(app.SPACE) + app.escape('/')
-    )
-    params_lst = apf.all_captures(pattern, rxn_dstr)
-
-    # Build dictionary of parameters, indexed by parameter
-    if params_lst:
-        params_dct = {}
-        for params in params_lst:
-            pressure = float(params[0])
-            vals = list(map(float, params[1:]))
-            if pressure not in params_dct:
-                params_dct[pressure] = [vals]
-            else:
-                params_dct[pressure].append(vals)
-    else:
-        params_dct = None
+    if 'PLOG' not in rxn_dstr:
+        return None
 
-    return params_dct
+    params_lst = _auxiliary_captures(rxn_dstr)['plog']
+    if not params_lst:
+        return None
 
+    # Build dictionary of parameters, indexed by pressure
+    params_dct = defaultdict(list)
+    for pressure, val1, val2, val3 in params_lst:
+        params_dct[float(pressure)].append(
+            [float(val1), float(val2), float(val3)])
 
-def collider_enhance_factors(rxn_dstr):
+    return dict(params_dct)
+
+
+def buffer_enhance_factors(rxn_dstr):
     """ Parses the data string for a reaction in the reactions block
         for the line containing the names of several bath gases and
         their corresponding collision enhancement factors.
@@ -439,30 +535,12 @@ def collider_enhance_factors(rxn_dstr):
         :rtype: dict[bath name: enhancement factors]
     """
 
-    first_str = _first_line_pattern(
-        rct_ptt=SPECIES_NAMES_PATTERN,
-        prd_ptt=SPECIES_NAMES_PATTERN,
-        param_ptt=COEFF_PATTERN)
-    bad_strings = ('DUP', 'LOW', 'TROE', 'CHEB', 'PLOG', first_str)
-
-    species_char = app.one_of_these([
-        app.LETTER, app.DIGIT,
-        app.escape('('), app.escape(')'),
-        app.UNDERSCORE])
-    species_name = app.one_or_more(species_char)
-
     # Loop over the lines and search for string with collider facts
     factors = {}
-    if apf.has_match('LOW', rxn_dstr) or apf.has_match('TROE', rxn_dstr):
+    if 'LOW' in rxn_dstr or 'TROE' in rxn_dstr:
         for line in rxn_dstr.splitlines():
-            if not any(apf.has_match(string, line) for string in bad_strings):
-                factor_pattern = (
-                    app.capturing(species_name) +
-                    app.escape('/') + app.maybe(app.SPACE) +
-                    app.capturing(app.NUMBER) +
-                    app.escape('/')
-                )
-                baths = apf.all_captures(factor_pattern, line)
+            if not _BUFFER_BAD_LINE_RE.search(line):
+                baths = _BUFFER_FACTOR_RE.findall(line)
                 if baths:
                     factors = {}
                     for bath in baths:
@@ -477,47 +555,12 @@ def ratek_fit_info(rxn_dstr):
     """
 
     # Read the temperatures and the Errors from the lines
-    pressure_ptt = (
-        'Pressure:' + app.SPACES +
-        app.capturing(app.one_of_these([app.FLOAT, 'High']))
-    )
-    trange_ptt = (
-        'Temps: ' + app.SPACES +
-        app.capturing(app.INTEGER) + '-' + app.capturing(app.INTEGER) +
-        app.SPACES + 'K'
-    )
-    mean_ptt = (
-        'MeanAbsErr:' + app.SPACES +
-        app.capturing(app.FLOAT) + app.escape('%') +
-        ','
-    )
-    max_ptt = (
-        'MaxErr:' + app.SPACES +
-        app.capturing(app.FLOAT) + app.escape('%')
-    )
-    pressure_caps = apf.all_captures(pressure_ptt, rxn_dstr)
-    trange_caps = apf.all_captures(trange_ptt, rxn_dstr)
-    mean_caps = apf.all_captures(mean_ptt, rxn_dstr)
-    max_caps = apf.all_captures(max_ptt, rxn_dstr)
-
-    pressures = []
-    for pressure in pressure_caps:
-        if pressure != 'High':
-            pressures.append(float(pressure))
-        elif pressure == 'High':
-            pressures.append(pressure)
-    trange_vals = []
-    for cap in trange_caps:
-        temp1, temp2 = cap
-        trange_vals.append([int(temp1), int(temp2)])
-    if mean_caps is not None:
-        mean_vals = [float(val) for val in mean_caps]
-    else:
-        mean_vals = []
-    if max_caps is not None:
-        max_vals = [float(val) for val in max_caps]
-    else:
-        max_vals = []
+    pressures = [pressure if pressure == 'High' else float(pressure)
+                 for pressure in _FIT_PRESSURE_RE.findall(rxn_dstr)]
+    trange_vals = [[int(temp1), int(temp2)]
+                   for temp1, temp2 in _FIT_TRANGE_RE.findall(rxn_dstr)]
+    mean_vals = [float(val) for val in _FIT_MEAN_ERR_RE.findall(rxn_dstr)]
+    max_vals = [float(val) for val in _FIT_MAX_ERR_RE.findall(rxn_dstr)]
 
     # Build the inf_dct
     inf_dct = {}
@@ -532,23 +575,6 @@ def ratek_fit_info(rxn_dstr):
 
 
 # HELPER FUNCTIONS #
-def _first_line_pattern(rct_ptt, prd_ptt, param_ptt):
-    """ Defines the pattern for the first line in a reaction data
-        string that contains the chemical equation and high-pressure
-        fitting parameters for the reaction.
-
-        :param rct_ptt: string pattern for the reactant species
-        :type rct_ptt: str
-        :param prd_ptt: string pattern for the product species
-        :type prd_ptt: str
-        :param param_ptt: string pattern for high-pressure parameters
-        :type param_ptt: str
-        :rtype: str
-    """
-    return (rct_ptt + app.padded(CHEMKIN_ARROW) + prd_ptt +
-            app.LINESPACES + param_ptt)
-
-
 def _split_reagent_string(rgt_str):
     """ Parses out the names of all the species given in a string with
         the chemical equation within the reactions block.
@@ -568,18 +594,34 @@ def _split_reagent_string(rgt_str):
             :return: rgts: names of species from string
             :rtype: list(str)
         """
-        _pattern = (app.STRING_START + app.capturing(app.maybe(app.DIGIT)) +
-                    app.capturing(app.one_or_more(app.NONSPACE)))
-        cnt, rgt = apf.first_capture(_pattern, rgt_cnt_str)
-        cnt = int(cnt) if cnt else 1
+        if rgt_cnt_str[:1].isdigit():
+            cnt, rgt = int(rgt_cnt_str[0]), rgt_cnt_str[1:]
+        else:
+            cnt, rgt = 1, rgt_cnt_str
         rgts = (rgt,) * cnt
         return rgts
 
-    rgt_str = apf.remove(app.LINESPACES, rgt_str)
-    rgt_str = apf.remove(CHEMKIN_PAREN_PLUS_EM, rgt_str)
-    rgt_str = apf.remove(CHEMKIN_PLUS_EM, rgt_str)
-    pattern = app.PLUS + app.not_followed_by(app.PLUS)
-    rgt_cnt_strs = apf.split(pattern, rgt_str)
+    def _split_on_plus(string):
+        """ Split a reagent string at each '+' that is not followed by
+            another '+', so that trailing pluses in ionic species names
+            stay attached to the name.
+
+            :param string: joined string of reagents
+            :type string: str
+            :rtype: list(str)
+        """
+        strs = []
+        start = 0
+        for idx, char in enumerate(string):
+            if char == '+' and string[idx+1:idx+2] != '+':
+                strs.append(string[start:idx])
+                start = idx + 1
+        strs.append(string[start:])
+        return strs
+
+    rgt_str = rgt_str.replace(' ', '').replace('\t', '')
+    rgt_str = rgt_str.replace('(+M)', '').replace('+M', '')
+    rgt_cnt_strs = _split_on_plus(rgt_str)
     rgts = tuple(itertools.chain(*map(_interpret_reagent_count, rgt_cnt_strs)))
 
     return rgts
@@ -2,13 +2,12 @@
 """
 
 import os
+from pathlib import Path
 import chemkin_io
 
 
 def _read_file(file_name):
-    with open(file_name, encoding='utf8', errors='ignore') as file_obj:
-        file_str = file_obj.read()
-    return file_str
+    return Path(file_name).read_text(encoding='utf8', errors='ignore')
 
 
 # Set paths
@@ -2,6 +2,7 @@
   Additional functions for formatting information for MESS strings
 """
 
+import functools
 import numpy
 from qcelemental import constants as qcc
 from qcelemental import periodictable as ptab
@@ -11,6 +12,18 @@ from ioformat import remove_trail_whitespace
 BOHR2ANG = qcc.conversion_factor('bohr', 'angstrom')
 
 
+@functools.lru_cache(maxsize=256)
+def _atomic_number(sym):
+    """ Obtains the atomic number for a given atomic symbol, caching
+        the periodic-table lookup module-wide.
+
+        :param sym: atomic symbol
+        :type sym: str
+        :rtype: int
+    """
+    return int(ptab.to_Z(sym))
+
+
 def write_data_str(geoms, grads, hessians):
     """ Writes a string containing the geometry, gradient, and Hessian
         for either a single species or points along a reaction path
@@ -33,19 +46,23 @@ def write_data_str(geoms, grads, hessians):
     #     hessians = [hessians]
     nsteps = len(geoms)
 
-    data_str = ''
+    # Compute the atomic numbers for each step up front so that the
+    # gradient formatter does not rebuild them for every step
+    atom_lsts = [[_atomic_number(sym) for sym, _ in geo] for geo in geoms]
+
+    parts = []
     for i, (geo, grad, hess) in enumerate(zip(geoms, grads, hessians)):
-        data_str += 'Step    {0}\n'.format(str(i+1))
-        data_str += 'geometry\n'
-        data_str += _format_geom_str(geo)
-        data_str += 'gradient\n'
-        data_str += _format_grad_str(geo, grad)
-        data_str += 'Hessian\n'
-        data_str += _format_hessian_str(hess)
+        parts.append('Step    {0}\n'.format(str(i+1)))
+        parts.append('geometry\n')
+        parts.append(_format_geom_str(geo))
+        parts.append('gradient\n')
+        parts.append(_format_grad_str(atom_lsts[i], grad))
+        parts.append('Hessian\n')
+        parts.append(_format_hessian_str(hess))
         if i != nsteps-1:
-            data_str += '\n'
+            parts.append('\n')
 
-    return remove_trail_whitespace(data_str)
+    return remove_trail_whitespace(''.join(parts))
 
 
 def _format_geom_str(geom):
@@ -56,44 +73,83 @@ def _format_geom_str(geom):
         :rtype: str
     """
 
-    # Format the strings for the xyz coordinates
-    geom_str = ''
-    for i, (sym, coords) in enumerate(geom):
-        anum = int(ptab.to_Z(sym))
-        coords = [coord * BOHR2ANG for coord in coords]
-        coords_str = '{0:>14.8f}{1:>14.8f}{2:>14.8f}'.format(
-            coords[0], coords[1], coords[2])
-        geom_str += '{0:2d}{1:4d}{2:4d}{3}\n'.format(
-            i+1, anum, 0, coords_str)
+    # Convert the coordinates in bulk and format the lines in one pass
+    anums = [_atomic_number(sym) for sym, _ in geom]
+    coords = numpy.array(
+        [xyz for _, xyz in geom], dtype=numpy.float64) * BOHR2ANG
+
+    geom_str = ''.join(
+        '{0:2d}{1:4d}{2:4d}{3:>14.8f}{4:>14.8f}{5:>14.8f}\n'.format(
+            i+1, anum, 0, xyz[0], xyz[1], xyz[2])
+        for i, (anum, xyz) in enumerate(zip(anums, coords)))
 
     return remove_trail_whitespace(geom_str)
 
 
-def _format_grad_str(geom, grad):
+def _format_grad_str(atom_list, grad):
     """ Formats the gradient into a string used for the ProjRot input file.
 
-        :param geom: geometries (Angstrom)
-        :type geom: list
+        :param atom_list: atomic numbers for the atoms in the geometry
+        :type atom_list: list(int)
         :param grads: gradients (Eh/Bohr)
         :type grads: list
         :rtype: str
     """
 
-    atom_list = []
-    for i, (sym, _) in enumerate(geom):
-        atom_list.append(int(ptab.to_Z(sym)))
-
-    # Format the strings for the xyz gradients
-    full_grads_str = ''
-    for i, grads in enumerate(grad):
-        grads_str = '{0:>14.8f}{1:>14.8f}{2:>14.8f}'.format(
-            grads[0], grads[1], grads[2])
-        full_grads_str += '{0:2d}{1:4d}{2}\n'.format(
-            i+1, atom_list[i], grads_str)
+    # Format the strings for the xyz gradients in a single pass
+    full_grads_str = ''.join(
+        '{0:2d}{1:4d}{2:>14.8f}{3:>14.8f}{4:>14.8f}\n'.format(
+            i+1, atom_list[i], grads[0], grads[1], grads[2])
+        for i, grads in enumerate(grad))
 
     return remove_trail_whitespace(full_grads_str)
 
 
+@functools.lru_cache(maxsize=64)
+def _hessian_layout(nrows, ncols):
+    """ Builds the line layout for printing a Hessian of a given shape:
+        fixed header strings are emitted verbatim, while each data row
+        is described by its row index, column slice, and terminator.
+        The shape is constant across the steps of a reaction path, so
+        the layout is computed once and cached.
+
+        :param nrows: number of rows in the Hessian
+        :type nrows: int
+        :param ncols: number of columns in the Hessian
+        :type ncols: int
+        :rtype: tuple
+    """
+
+    if nrows % 5 == 0:
+        nchunks = nrows // 5
+    else:
+        nchunks = (nrows // 5) + 1
+
+    layout = ['   ' + '    '.join([str(val) for val in range(1, 6)]) + '\n']
+    for cnt in range(nchunks):
+        # Each chunk holds the lower-triangle rows, at most five wide
+        col_start = 5 * cnt
+        for i in range(col_start, nrows):
+            col_stop = min(i+1, col_start+5)
+            if col_stop - col_start == 5 or i < ncols-1:
+                end = '\n'
+            else:
+                end = ''
+            layout.append((i, col_start, col_stop, end))
+        if cnt+1 < nchunks-1:
+            val_str = '     '.join(
+                [str(val)
+                 for val in range(col_start + 6, col_start + 11)])
+            layout.append('    ' + val_str + '\n')
+        elif cnt+1 == nchunks-1:
+            val_str = '     '.join(
+                [str(val)
+                 for val in range(col_start + 6, nrows+1)])
+            layout.append('    ' + val_str + '\n')
+
+    return tuple(layout)
+
+
 def _format_hessian_str(hess):
     """ Formats the Hessian into a string used for the ProjRot input file.
 
@@ -102,47 +158,20 @@ def _format_hessian_str(hess):
         :rtype: str
     """
 
-    # Format the Hessian
+    # Format the Hessian following the cached layout for its shape
     hess = numpy.array(hess)
     nrows = numpy.shape(hess)[0]
     ncols = numpy.shape(hess)[1]
 
-    if nrows % 5 == 0:
-        nchunks = nrows // 5
-    else:
-        nchunks = (nrows // 5) + 1
-
-    hess_str = '   ' + '    '.join([str(val) for val in range(1, 6)]) + '\n'
-    cnt = 0
-    while cnt+1 <= nchunks:
-        for i in range(nrows):
-            col_tracker = 1
-            if i >= 5*cnt:
-                hess_str += '{0}'.format(str(i+1))
-                for j in range(5*cnt, ncols):
-                    if i >= j:
-                        if col_tracker <= 5:
-                            hess_str += '  {0:5.8f}'.format(hess[i][j])
-                            col_tracker += 1
-                            if col_tracker == 6:
-                                hess_str += '\n'
-                        else:
-                            continue
-                    elif i < j and col_tracker != 6:
-                        hess_str += '\n'
-                        break
-                    else:
-                        break
-            if i+1 == nrows and cnt+1 < nchunks-1:
-                val_str = '     '.join(
-                    [str(val)
-                     for val in range(5*(cnt+1) + 1, 5*(cnt+1) + 6)])
-                hess_str += '    ' + val_str + '\n'
-            if i+1 == nrows and cnt+1 == nchunks-1:
-                val_str = '     '.join(
-                    [str(val)
-                     for val in range(5*(cnt+1) + 1, nrows+1)])
-                hess_str += '    ' + val_str + '\n'
-        cnt += 1
-
-    return remove_trail_whitespace(hess_str)
+    parts = []
+    for item in _hessian_layout(nrows, ncols):
+        if isinstance(item, str):
+            parts.append(item)
+        else:
+            i, col_start, col_stop, end = item
+            parts.append(str(i+1))
+            parts.append(''.join('  {0:5.8f}'.format(val)
+                                 for val in hess[i][col_start:col_stop]))
+            parts.append(end)
+
+    return remove_trail_whitespace(''.join(parts))